@@ -1,41 +1,77 @@
 import datetime
+import sys
+from types import MappingProxyType
+
+# Noms des mois pour l'affichage
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Tables de conversion pour permettre une interface flexible
+# Accepter l'abréviation (3 lettres) ou le nom complet : les deux partagent
+# les 3 premières lettres, une seule entrée (valeur, nom complet) par mois/jour suffit
+# Construites une seule fois au niveau du module et en lecture seule
+_MONTH3 = MappingProxyType({name[:3].lower(): (i, name.lower()) for i, name in enumerate(_MONTH_NAMES, 1)})
+_DAY3 = MappingProxyType({name[:3].lower(): (i, name.lower()) for i, name in enumerate(_DAY_NAMES)})
+
+
+def _lookup(table, name):
+    # Retourne la valeur associée à l'abréviation ou au nom complet, None sinon
+    key = name[:3]
+    entry = table.get(key)
+    if entry is None or (name != key and name != entry[1]):
+        return None
+    return entry[0]
+
+
+# Cellules de jour pré-formatées sur 2 caractères pour garantir l'alignement des colonnes
+# L'indice 0 correspond aux cases hors du mois (remplies d'espaces)
+_DAY_STRS = ["  "] + [f"{i:2d}" for i in range(1, 32)]
+
+# En-têtes des jours de la semaine ordonnés selon le jour de début, un par décalage
+# La rotation garantit que l'affichage commence par le jour choisi
+_DAYS = ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]
+_WEEKDAY_HEADERS = [" ".join(_DAYS[i:] + _DAYS[:i]) for i in range(7)]
+
+# Décalages mensuels de l'algorithme de Sakamoto et nombre de jours par mois
+_SAKAMOTO_OFFSETS = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _first_weekday(year, month):
+    # Jour de la semaine du 1er du mois (lundi = 0, comme datetime.weekday())
+    # Calculé par l'algorithme de Sakamoto plutôt qu'en construisant un objet datetime
+    if month < 3:
+        year -= 1
+    return (year + year // 4 - year // 100 + year // 400 + _SAKAMOTO_OFFSETS[month - 1]) % 7
+
+
+def _month_length(year, month):
+    # Février compte un jour de plus les années bissextiles
+    if month == 2 and _is_leap(year):
+        return 29
+    return _MONTH_LENGTHS[month - 1]
 
 class Cal:
+    # Attributs fixes : pas de __dict__ par instance
+    __slots__ = ("_year", "_month", "_week_start")
+
     def __init__(self):
         # Initialisation avec l'année et le mois actuels pour que je
         # n'ai pas besoin de les spécifier si je veux le calendrier du mois en cours
-        self._year = datetime.datetime.now().year
-        self._month = datetime.datetime.now().month
+        # Un seul appel à now() suffit pour obtenir l'année et le mois
+        now = datetime.datetime.now()
+        self._year, self._month = now.year, now.month
         
         # Définit le début de la semaine à lundi (0) par défaut
         # Cette valeur de décalage sera utilisée pour réorganiser l'affichage des jours
         self._week_start = 0
-        
-        # Dictionnaires de conversion pour permettre une interface flexible
-        # Accepter plusieurs formats de saisie
-        self._month_dict = {
-            "jan": 1, "january": 1, 
-            "feb": 2, "february": 2,
-            "mar": 3, "march": 3, 
-            "apr": 4, "april": 4,
-            "may": 5, 
-            "jun": 6, "june": 6,
-            "jul": 7, "july": 7, 
-            "aug": 8, "august": 8,
-            "sep": 9, "september": 9, 
-            "oct": 10, "october": 10,
-            "nov": 11, "november": 11,
-            "dec": 12, "december": 12
-        }
-        self._day_dict = {
-            "mon": 0, "monday": 0,
-            "tue": 1, "tuesday": 1,
-            "wed": 2, "wednesday": 2,
-            "thu": 3, "thursday": 3,
-            "fri": 4, "friday": 4,
-            "sat": 5, "saturday": 5,
-            "sun": 6, "sunday": 6
-        }
 
     def year(self, year):
         # Méthode simple pour définir l'année
@@ -48,10 +84,10 @@ class Cal:
         # Cette flexibilité permet d'utiliser soit des nombres, soit des noms
         if isinstance(month, str):
             month = month.lower()
-            if month in self._month_dict:
-                self._month = self._month_dict[month]
-            else:
+            value = _lookup(_MONTH3, month)
+            if value is None:
                 raise ValueError(f"Mois invalide: {month}")
+            self._month = value
         else:
             self._month = month
         return self
@@ -60,65 +96,39 @@ class Cal:
         # Convertit le jour de début de semaine en décalage
         # Cette personnalisation permet d'adapter l'affichage aux conventions régionales
         day = day.lower()
-        if day in self._day_dict:
-            self._week_start = self._day_dict[day]
-        else:
+        value = _lookup(_DAY3, day)
+        if value is None:
             raise ValueError(f"Jour de début de semaine invalide: {day}")
+        self._week_start = value
         return self
     
     def print(self):
-        # Noms des mois pour l'affichage
-        month_names = [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ]
-        
-        # Jours de la semaine ordonnés selon le jour de début
-        # La rotation garantit que l'affichage commence par le jour choisi
-        days = ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]
-        weekdays = days[self._week_start:] + days[:self._week_start]
+        # Les calculs de date ci-dessous n'utilisent plus datetime: les valeurs
+        # hors limites doivent être rejetées explicitement
+        if not 1 <= self._month <= 12:
+            raise ValueError(f"Mois invalide: {self._month}")
+        if self._year < 1:
+            raise ValueError(f"Année invalide: {self._year}")
         
+        # Les lignes sont accumulées puis écrites en une seule fois sur stdout
         # Affiche l'en-tête du calendrier
         # Formatage centré pour un affichage esthétique
-        print(f"    {month_names[self._month-1]} {self._year}")
-        print(" ".join(weekdays))
+        out = [f"    {_MONTH_NAMES[self._month-1]} {self._year}", _WEEKDAY_HEADERS[self._week_start]]
         
         # Calcule le premier jour du mois
         # Détermine où commencer l'affichage du calendrier
-        first_day = datetime.datetime(self._year, self._month, 1)
-        weekday = (first_day.weekday() - self._week_start) % 7
-        
-        # Calcule le dernier jour du mois
-        # Gestion spéciale pour décembre pour éviter les problèmes de limite d'année
-        if self._month == 12:
-            last_day = datetime.datetime(self._year + 1, 1, 1) - datetime.timedelta(days=1)
-        else:
-            last_day = datetime.datetime(self._year, self._month + 1, 1) - datetime.timedelta(days=1)
-        last_date = last_day.day
-        
-        # Construit les lignes du calendrier
-        # Ajoute des espaces pour aligner correctement le premier jour
-        line = ["  "] * weekday
-        day = 1
-        
-        while day <= last_date:
-            # Formatage à 2 caractères pour garantir l'alignement des colonnes
-            line.append(f"{day:2d}")
-            day += 1
-            
-            if len(line) == 7:
-                # Imprime une ligne complète de la semaine
-                print(" ".join(line))
-                line = []
+        weekday = (_first_weekday(self._year, self._month) - self._week_start) % 7
         
-        # Imprime la dernière ligne si nécessaire
-        # Complète avec des espaces pour maintenir l'alignement
-        if line:
-            line += ["  "] * (7 - len(line))
-            print(" ".join(line))
+        # Construit les cases du calendrier
+        # Ajoute des espaces pour aligner le premier jour, puis complète la
+        # dernière semaine pour maintenir l'alignement
+        cells = ["  "] * weekday + _DAY_STRS[1:_month_length(self._year, self._month) + 1]
+        cells += ["  "] * (-len(cells) % 7)
+        for i in range(0, len(cells), 7):
+            out.append(" ".join(cells[i:i + 7]))
         
         # Ligne vide à la fin pour meilleure lisibilité
-        print()
+        sys.stdout.write("\n".join(out) + "\n\n")
 
 c = Cal()
 c.year(2025)
@@ -1,15 +1,29 @@
+import copy
 import unittest
 from unittest.mock import patch
 import datetime
 from cal import Cal
 import io
-import sys
+from contextlib import redirect_stdout
 
 class TestCal(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls):
+        # Une seule instance de référence construite pour toute la classe
+        cls._template_cal = Cal()
+    
     def setUp(self):
-        # Création d'une instance fraîche pour chaque test
-        self.cal = Cal()
+        # Copie fraîche de l'instance de référence pour chaque test
+        # Les tests peuvent la modifier sans affecter les autres
+        self.cal = copy.copy(self._template_cal)
+    
+    def _capture(self, fn):
+        # Capture de stdout, restauré même si fn lève une exception
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            fn()
+        return buf.getvalue()
     
     def test_init_defaults(self):
         # Test des valeurs par défaut lors de l'initialisation
@@ -50,6 +64,12 @@ class TestCal(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.cal.month("invalid_month")
     
+    def test_month_string_invalid_suffix(self):
+        # Test avec un nom de mois dont seules les 3 premières lettres sont valides
+        # Seuls l'abréviation et le nom complet doivent être acceptés
+        with self.assertRaises(ValueError):
+            self.cal.month("janx")
+    
     def test_week_start(self):
         # Test du réglage du jour de début de semaine
         result = self.cal.week_start("sun")
@@ -65,14 +85,7 @@ class TestCal(unittest.TestCase):
         # Test de la sortie générée par print()
         self.cal.year(2025).month(2).week_start("mon")
         
-        # Redirection de stdout pour capture
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-        
-        self.cal.print()
-        
-        # Restauration de stdout
-        sys.stdout = sys.__stdout__
+        output = self._capture(self.cal.print)
         
         # Ajustement pour correspondre à la sortie réelle avec espaces à la fin des lignes
         expected_output = """    February 2025
@@ -84,19 +97,14 @@ Mo Tu We Th Fr Sa Su
 24 25 26 27 28      
 
 """
-        self.assertEqual(captured_output.getvalue(), expected_output)
+        self.assertEqual(output, expected_output)
     
     def test_print_with_sunday_start(self):
         # Test avec dimanche comme premier jour de la semaine
         # Vérifie que le décalage des jours fonctionne correctement
         self.cal.year(2025).month(2).week_start("sun")
         
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-        
-        self.cal.print()
-        
-        sys.stdout = sys.__stdout__
+        output = self._capture(self.cal.print)
         
         # Ajustement pour correspondre à la sortie réelle avec espaces à la fin des lignes
         expected_output = """    February 2025
@@ -108,37 +116,62 @@ Su Mo Tu We Th Fr Sa
 23 24 25 26 27 28   
 
 """
-        self.assertEqual(captured_output.getvalue(), expected_output)
+        self.assertEqual(output, expected_output)
     
     def test_print_month_with_31_days(self):
         # Test avec un mois de 31 jours
         # Vérifie que la classe gère correctement les mois de différentes longueurs
         self.cal.year(2025).month(1).week_start("mon")
         
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-        
-        self.cal.print()
-        
-        sys.stdout = sys.__stdout__
+        output = self._capture(self.cal.print)
         
         # Vérification que le mois complet est affiché
-        self.assertIn("31", captured_output.getvalue())
+        self.assertIn("31", output)
     
     def test_print_december_to_january_transition(self):
         # Test de la transition décembre à janvier
         # Vérifie que le calcul du dernier jour fonctionne correctement lors du changement d'année
         self.cal.year(2024).month(12).week_start("mon")
         
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-        
-        self.cal.print()
-        
-        sys.stdout = sys.__stdout__
+        output = self._capture(self.cal.print)
         
         # Vérification que le mois complet est affiché
-        self.assertIn("31", captured_output.getvalue())
+        self.assertIn("31", output)
+    
+    def test_print_invalid_month(self):
+        # Test avec un mois numérique hors de l'intervalle 1-12
+        # L'affichage doit échouer plutôt que d'afficher un autre mois
+        for month in (0, -1, 13):
+            with self.subTest(month=month):
+                self.cal.year(2025).month(month)
+                with self.assertRaises(ValueError):
+                    self._capture(self.cal.print)
+    
+    def test_print_invalid_year(self):
+        # Test avec une année antérieure à l'an 1
+        self.cal.year(0).month(1)
+        with self.assertRaises(ValueError):
+            self._capture(self.cal.print)
+    
+    def test_print_february_leap_years(self):
+        # Test du nombre de jours de février selon les règles des années bissextiles
+        # 2024 est divisible par 4, 1900 par 100 mais pas 400, 2000 par 400
+        for year, last_day in ((2024, "29"), (1900, "28"), (2000, "29"), (2025, "28")):
+            with self.subTest(year=year):
+                self.cal.year(year).month(2)
+                output = self._capture(self.cal.print)
+                self.assertEqual(output.split()[-1], last_day)
+    
+    def test_print_first_weekday(self):
+        # Test du premier jour du mois comparé à datetime, sur plusieurs siècles
+        # Avec lundi comme début de semaine, le 1er est précédé d'une case vide par jour
+        for year in (1, 1600, 1900, 1999, 2000, 2024, 2100, 2999):
+            for month in range(1, 13):
+                with self.subTest(year=year, month=month):
+                    self.cal.year(year).month(month).week_start("mon")
+                    first_week = self._capture(self.cal.print).splitlines()[2]
+                    expected = datetime.date(year, month, 1).weekday()
+                    self.assertEqual(first_week.index(" 1"), expected * 3)
     
     @patch('datetime.datetime')
     def test_init_with_mocked_date(self, mock_datetime):
@@ -153,6 +186,8 @@ Su Mo Tu We Th Fr Sa
         
         self.assertEqual(cal._year, 2023)
         self.assertEqual(cal._month, 5)
+        # Un seul appel à now() pour obtenir l'année et le mois
+        mock_datetime.now.assert_called_once()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
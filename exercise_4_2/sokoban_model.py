@@ -15,6 +15,16 @@ class Symbol(Enum):
     FLOOR = "-"
 
 
+# Symbol values bound once at module level: `Symbol.BOX.value` in a case
+# pattern is looked up again for every character parsed.
+_BOX = Symbol.BOX.value
+_BOX_ON_GOAL = Symbol.BOX_ON_GOAL.value
+_PLAYER = Symbol.PLAYER.value
+_PLAYER_ON_GOAL = Symbol.PLAYER_ON_GOAL.value
+_GOAL = Symbol.GOAL.value
+_WALL = Symbol.WALL.value
+
+
 class MoveResponse(Enum):
     INVALID_WALL = "can't push walls"
     INVALID_BOX = "can't push this box"
@@ -43,34 +53,34 @@ class SokobanModel:
 
         # We'll assume the level data is well formed (all lines are the
         # same length).
+        # All rows have the same type, so check for strip() once rather
+        # than once per row.
+        if level_data and hasattr(level_data[0], 'strip'):
+            level_data = [row.strip() for row in level_data]
+
         self.size = [0, 0]
         if level_data and len(level_data) > 0:
-            if hasattr(level_data[0], 'strip'):
-                self.size = [len(level_data[0].strip()), len(level_data)]
-            else:
-                self.size = [len(level_data[0]), len(level_data)]
+            self.size = [len(level_data[0]), len(level_data)]
 
         for y, row in enumerate(level_data):
-            row_str = row.strip() if hasattr(row, 'strip') else row
-            for x, symbol in enumerate(row_str):
+            for x, symbol in enumerate(row):
                 pos = (x, y)
-                match symbol:
-                    case Symbol.BOX.value:
-                        self.boxes.add(pos)
-                    case Symbol.BOX_ON_GOAL.value:
-                        self.boxes.add(pos)
-                        self.goals.add(pos)
-                    case Symbol.PLAYER.value:
-                        self.player = pos
-                    case Symbol.PLAYER_ON_GOAL.value:
-                        self.player = pos
-                        self.goals.add(pos)
-                    case Symbol.GOAL.value:
-                        self.goals.add(pos)
-                    case Symbol.WALL.value:
-                        self.walls.add(pos)
-                    # Anything that's not a goal/player/box/wall is implied to
-                    # be a floor. We don't keep track of floors.
+                if symbol == _WALL:
+                    self.walls.add(pos)
+                elif symbol == _BOX:
+                    self.boxes.add(pos)
+                elif symbol == _GOAL:
+                    self.goals.add(pos)
+                elif symbol == _BOX_ON_GOAL:
+                    self.boxes.add(pos)
+                    self.goals.add(pos)
+                elif symbol == _PLAYER:
+                    self.player = pos
+                elif symbol == _PLAYER_ON_GOAL:
+                    self.player = pos
+                    self.goals.add(pos)
+                # Anything that's not a goal/player/box/wall is implied to
+                # be a floor. We don't keep track of floors.
 
     def is_empty(self, x, y):
         pos = (x, y)
@@ -128,4 +138,5 @@ class SokobanModel:
         Check if all goals are covered by boxes.
         Returns True if all goals have a box on them, False otherwise.
         """
-        return all(goal in self.boxes for goal in self.goals)
\ No newline at end of file
+        # Set inclusion is checked in C, without a Python-level loop
+        return self.goals <= self.boxes
\ No newline at end of file
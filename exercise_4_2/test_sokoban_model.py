@@ -2,25 +2,31 @@ import unittest
 
 from sokoban_model import MoveResponse, SokobanModel, Symbol
 
-SIMPLE_LEVEL = """######
-#-$-.#
-#-$-.#
-#-@--#
-######""".splitlines()
+SIMPLE_LEVEL = (
+    "######",
+    "#-$-.#",
+    "#-$-.#",
+    "#-@--#",
+    "######",
+)
 
 # Level where one box is already on a goal
-PARTIAL_COMPLETE_LEVEL = """######
-#-$-.#
-#-*-.#
-#-@--#
-######""".splitlines()
+PARTIAL_COMPLETE_LEVEL = (
+    "######",
+    "#-$-.#",
+    "#-*-.#",
+    "#-@--#",
+    "######",
+)
 
 # Using a very simple level for completion test
 # Just one box that's already on a goal
-COMPLETE_LEVEL = """###
-#*#
-#@#
-###""".splitlines()
+COMPLETE_LEVEL = (
+    "###",
+    "#*#",
+    "#@#",
+    "###",
+)
 
 
 class TestSokobanModel(unittest.TestCase):
@@ -75,9 +81,11 @@ class TestSokobanModel(unittest.TestCase):
     # This test simulates actual gameplay to ensure the game can be completed through player actions
     def test_completing_level_through_moves(self):
         # Create a custom level with a simpler path to completion for testing
-        custom_level = """#####
-#@$.#
-#####""".splitlines()
+        custom_level = (
+            "#####",
+            "#@$.#",
+            "#####",
+        )
         
         model = SokobanModel(custom_level)
         
@@ -1,5 +1,7 @@
 import os
+import random
 import pygame
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 """
@@ -33,52 +35,201 @@ class MoveResponse(Enum):
     VALID = "valid"
 
 
+# Drapeaux binaires décrivant le contenu d'une case de la grille du modèle
+# Une case peut cumuler plusieurs drapeaux (ex: BOX | GOAL pour une boîte sur un objectif)
+WALL = 1
+BOX = 2
+GOAL = 4
+# Drapeau réservé à l'affichage: le joueur n'est pas stocké dans la grille
+PLAYER = 8
+# Masque précalculé des drapeaux qui empêchent d'entrer dans une case
+BLOCKED = WALL | BOX
+
+# Symbole d'affichage correspondant à chaque combinaison de drapeaux possible
+SYMBOL_BY_FLAGS = {
+    0: Symbol.FLOOR,
+    WALL: Symbol.WALL,
+    BOX: Symbol.BOX,
+    GOAL: Symbol.GOAL,
+    BOX | GOAL: Symbol.BOX_ON_GOAL,
+    PLAYER: Symbol.PLAYER,
+    PLAYER | GOAL: Symbol.PLAYER_ON_GOAL,
+}
+
+# Drapeaux de la grille pour chaque caractère du fichier de niveau
+# Le joueur n'est pas stocké dans la grille, seul l'objectif sous lui l'est
+# Les caractères absents (sol, caractères inconnus) valent 0
+FLAGS_BY_CHAR = {
+    Symbol.WALL.value: WALL,
+    Symbol.BOX.value: BOX,
+    Symbol.BOX_ON_GOAL.value: BOX | GOAL,
+    Symbol.GOAL.value: GOAL,
+    Symbol.PLAYER_ON_GOAL.value: GOAL,
+}
+# Table de traduction octet -> drapeaux utilisée par bytes.translate
+_PARSE_TABLE = bytes(FLAGS_BY_CHAR.get(chr(c), 0) for c in range(256))
+
+
+def cell_flags(grid, width, height, x, y):
+    """
+    • Retourne les drapeaux de la case (x, y) d'une grille stockée ligne par ligne
+    • Les positions hors du plateau sont traitées comme des murs
+    """
+    if 0 <= x < width and 0 <= y < height:
+        return grid[y * width + x]
+    return WALL
+
+
+# Résultats possibles de try_move(): (réponse, boîte poussée)
+# Tuples créés une seule fois, try_move() n'alloue rien à chaque appel
+MOVED = (MoveResponse.VALID, False)
+PUSHED = (MoveResponse.VALID, True)
+BLOCKED_BY_BOX = (MoveResponse.INVALID_BOX, False)
+BLOCKED_BY_WALL = (MoveResponse.INVALID_WALL, False)
+
+
+def try_move(grid, width, height, x, y, dx, dy):
+    """
+    • Implémente les règles de déplacement de Sokoban:
+      1. Le joueur peut se déplacer dans un espace vide
+      2. Le joueur peut pousser une boîte si l'espace derrière est vide
+      3. Le joueur ne peut pas traverser les murs ou pousser des boîtes bloquées
+    • Travaille directement sur une grille de drapeaux (bytearray) et la position
+      (x, y) du joueur, sans SokobanModel: un solveur peut l'appeler sur ses propres
+      grilles sans créer de modèle
+    • Modifie la grille si une boîte est poussée, mais pas la position du joueur
+      (qui devient (x + dx, y + dy) si le mouvement est valide)
+    • Retourne MOVED, PUSHED, BLOCKED_BY_BOX ou BLOCKED_BY_WALL, des tuples
+      (réponse, boîte poussée) qui indiquent la cause d'un échec de mouvement
+    • Les positions hors du plateau sont traitées comme des murs; les tests de
+      limites et le calcul des indices sont écrits en ligne (chemin critique)
+    """
+    # nx, ny sont où le joueur essaie d'aller
+    nx = x + dx
+    ny = y + dy
+    if not (0 <= nx < width and 0 <= ny < height):
+        return BLOCKED_BY_WALL
+    i = ny * width + nx
+    target = grid[i]
+    if not target & BLOCKED:
+        # Cas 1: Se déplacer vers une case vide
+        return MOVED
+    if not target & BOX:
+        # Cas 3: Le joueur tente de traverser un mur
+        return BLOCKED_BY_WALL
+    # Cas 2: Le joueur tente de pousser une boîte
+    # nnx, nny sont où la boîte essaie d'aller
+    nnx = nx + dx
+    nny = ny + dy
+    if not (0 <= nnx < width and 0 <= nny < height):
+        return BLOCKED_BY_BOX
+    j = nny * width + nnx
+    if grid[j] & BLOCKED:
+        # La boîte est bloquée par un mur ou une autre boîte
+        return BLOCKED_BY_BOX
+    # La boîte peut être poussée
+    grid[i] = target & ~BOX
+    grid[j] |= BOX
+    return PUSHED
+
+
+# Tables de Zobrist par nombre de cases: (table des boîtes, table du joueur)
+# Construites une seule fois puis partagées par tous les modèles de même taille
+_ZOBRIST_TABLES = {}
+
+
+def zobrist_tables(n_cells):
+    """
+    • Retourne les tables de Zobrist (boîtes, joueur) d'un plateau de n_cells cases:
+      un nombre aléatoire de 64 bits par case et par type de pièce
+    • Graine fixe: les clés sont reproductibles d'une exécution à l'autre
+    • Mises en cache au niveau du module pour ne pas les régénérer à chaque
+      chargement ou redémarrage d'un niveau de même taille
+    """
+    tables = _ZOBRIST_TABLES.get(n_cells)
+    if tables is None:
+        rng = random.Random(0)
+        box_table = tuple(rng.getrandbits(64) for _ in range(n_cells))
+        player_table = tuple(rng.getrandbits(64) for _ in range(n_cells))
+        tables = _ZOBRIST_TABLES[n_cells] = (box_table, player_table)
+    return tables
+
+
 class SokobanModel:
     def __init__(self, level_data):
         """
-        • Utilise des ensembles (sets) pour les éléments du jeu plutôt que d'utiliser
-          une seule matrice pour représenter le plateau de jeu
-        • Cela simplifie la logique de déplacement et la détection des collisions
-        • Réduit la complexité lors de la gestion des cases qui contiennent à la fois
-          un objectif et un autre élément (joueur ou boîte)
-        """
-        self.walls = set()
-        self.boxes = set()
-        self.goals = set()
-
-        self.size = [0, 0]
-        if level_data and len(level_data) > 0:
-            # Vérification de la présence de la méthode strip() pour gérer différents types d'entrées
-            # (fichiers texte ou listes de chaînes)
-            if hasattr(level_data[0], 'strip'):
-                self.size = [len(level_data[0].strip()), len(level_data)]
-            else:
-                self.size = [len(level_data[0]), len(level_data)]
-
-        # Parcourt chaque caractère du niveau pour extraire la position des éléments
-        # Utilise le pattern matching (match/case) pour une meilleure lisibilité
-        for y, row in enumerate(level_data):
-            row_str = row.strip() if hasattr(row, 'strip') else row
-            for x, symbol in enumerate(row_str):
-                pos = (x, y)
-                match symbol:
-                    case Symbol.BOX.value:
-                        self.boxes.add(pos)
-                    case Symbol.BOX_ON_GOAL.value:
-                        # Une boîte sur un objectif est représentée en ajoutant la position 
-                        # à la fois dans l'ensemble des boîtes et dans celui des objectifs
-                        self.boxes.add(pos)
-                        self.goals.add(pos)
-                    case Symbol.PLAYER.value:
-                        self.player = pos
-                    case Symbol.PLAYER_ON_GOAL.value:
-                        self.player = pos
-                        self.goals.add(pos)
-                    case Symbol.GOAL.value:
-                        self.goals.add(pos)
-                    case Symbol.WALL.value:
-                        self.walls.add(pos)
-                    # Les cases vides (sol) ne sont pas stockées pour économiser de la mémoire
+        • Stocke le plateau dans une seule grille dense (bytearray, ligne par ligne)
+          plutôt que dans des ensembles de positions
+        • Chaque case contient des drapeaux binaires (WALL, BOX, GOAL): une recherche
+          se fait par un simple accès indexé, sans hachage de tuples
+        • Les drapeaux se cumulent, ce qui gère naturellement les cases qui contiennent
+          à la fois un objectif et une boîte
+        • Le joueur est stocké à part car il se déplace à chaque mouvement
+        """
+        # Vérification de la présence de la méthode strip() pour gérer différents types d'entrées
+        # (fichiers texte ou listes de chaînes), faite une seule fois: toutes les lignes
+        # sont du même type
+        if level_data and hasattr(level_data[0], 'strip'):
+            rows = [row.strip() for row in level_data]
+        else:
+            rows = ["".join(row) for row in level_data]
+        width = max(map(len, rows), default=0)
+        self.size = [width, len(rows)]
+        # Copies de size en attributs simples, lues à chaque move()
+        self._width, self._height = self.size
+
+        # Complète les lignes plus courtes avec du sol pour obtenir un rectangle, puis
+        # convertit tout le niveau en drapeaux d'un seul coup avec bytes.translate
+        # (les caractères non ASCII deviennent '?' pour garder un octet par case)
+        board = "".join(row.ljust(width, Symbol.FLOOR.value) for row in rows)
+        self.grid = bytearray(board.encode("ascii", "replace").translate(_PARSE_TABLE))
+
+        # Le joueur n'est pas dans la grille: on cherche sa dernière occurrence
+        # Sa position est gardée dans deux entiers (pas de tuple recréé à chaque mouvement)
+        # (-1, -1) si le niveau n'a pas de joueur
+        i = max(board.rfind(Symbol.PLAYER.value), board.rfind(Symbol.PLAYER_ON_GOAL.value))
+        self.player_x, self.player_y = (i % width, i // width) if i >= 0 else (-1, -1)
+
+        # Nombre d'objectifs, libres ou couverts, qui ne change plus après le chargement
+        self.n_goals = self.grid.count(GOAL) + self.grid.count(BOX | GOAL)
+
+        # Positions des boîtes, tenues à jour par move() pour que la vue n'ait pas
+        # à parcourir tout le plateau pour les trouver
+        self.box_positions = [
+            (i % width, i // width) for i, flags in enumerate(self.grid) if flags & BOX
+        ]
+
+        # Hachage de Zobrist des boîtes, combiné par XOR; move() le met à jour en deux
+        # XOR à chaque poussée au lieu de tout recalculer. La part du joueur n'est
+        # ajoutée que par state_key(): un simple pas ne touche pas au hachage
+        self._zobrist_box, self._zobrist_player = zobrist_tables(len(self.grid))
+        self.box_hash = 0
+        for (x, y) in self.box_positions:
+            self.box_hash ^= self._zobrist_box[y * width + x]
+
+        # État initial conservé pour pouvoir redémarrer sans relire le fichier
+        self._initial_box_hash = self.box_hash
+        self._initial_grid = bytes(self.grid)
+        self._initial_player = (self.player_x, self.player_y)
+        self._initial_box_positions = tuple(self.box_positions)
+
+    def reset(self):
+        """
+        • Remet le niveau dans son état initial (redémarrage)
+        • Recopie la grille conservée au chargement plutôt que de relire et
+          réanalyser le fichier du niveau
+        """
+        self.grid[:] = self._initial_grid
+        self.player_x, self.player_y = self._initial_player
+        self.box_positions[:] = self._initial_box_positions
+        self.box_hash = self._initial_box_hash
+
+    def cell(self, x, y):
+        """
+        • Retourne les drapeaux de la case (x, y)
+        • Les positions hors du plateau sont traitées comme des murs
+        """
+        return cell_flags(self.grid, self._width, self._height, x, y)
 
     def is_empty(self, x, y):
         """
@@ -86,44 +237,43 @@ class SokobanModel:
         • Simplifie les vérifications dans la méthode de déplacement
         • Plutôt que de vérifier ce qu'une case contient, on vérifie ce qu'elle ne contient pas
         """
-        pos = (x, y)
-        if pos in self.walls:
-            return False
-        if pos in self.boxes:
-            return False
-        return True
+        return self.cell(x, y) & BLOCKED == 0
 
     def move(self, dx, dy):
         """
-        • Implémente les règles de déplacement de Sokoban:
-          1. Le joueur peut se déplacer dans un espace vide
-          2. Le joueur peut pousser une boîte si l'espace derrière est vide
-          3. Le joueur ne peut pas traverser les murs ou pousser des boîtes bloquées
-        • Retourne un type de réponse plutôt qu'un simple booléen pour indiquer la cause 
-          d'un échec de mouvement
-        """
-        (x, y) = self.player
-        (nx, ny) = (x + dx, y + dy)  # nx, ny sont où le joueur essaie d'aller
-        if self.is_empty(nx, ny):
-            # Cas 1: Se déplacer vers une case vide
-            self.player = (nx, ny)
-            return MoveResponse.VALID
-        elif (nx, ny) in self.boxes:
-            # Cas 2: Le joueur tente de pousser une boîte
-            # nnx, nny sont où la boîte essaie d'aller
-            (nnx, nny) = (nx+dx, ny+dy)
-            if self.is_empty(nnx, nny):
-                # La boîte peut être poussée
-                self.boxes.remove((nx, ny))
-                self.boxes.add((nnx, nny))
-                self.player = (nx, ny)
-                return MoveResponse.VALID
-            else:
-                # La boîte est bloquée par un mur ou une autre boîte
-                return MoveResponse.INVALID_BOX
-        else:
-            # Cas 3: Le joueur tente de traverser un mur
-            return MoveResponse.INVALID_WALL
+        • Applique les règles de try_move() au plateau du modèle
+        • Met à jour la position du joueur et, si une boîte a été poussée, la liste
+          des positions des boîtes et leur hachage
+        """
+        x = self.player_x
+        y = self.player_y
+        width = self._width
+        result = try_move(self.grid, width, self._height, x, y, dx, dy)
+        if result is MOVED or result is PUSHED:
+            self.player_x = x + dx
+            self.player_y = y + dy
+            if result is PUSHED:
+                box_positions = self.box_positions
+                box_positions[box_positions.index((x + dx, y + dy))] = (x + 2 * dx, y + 2 * dy)
+                # Indices de l'ancienne et de la nouvelle case de la boîte
+                i = (y + dy) * width + x + dx
+                zobrist_box = self._zobrist_box
+                self.box_hash ^= zobrist_box[i] ^ zobrist_box[i + dy * width + dx]
+        return result[0]
+
+    def state_key(self):
+        """
+        • Retourne une clé entière de l'état dynamique du plateau (boîtes et joueur)
+        • Les murs et objectifs ne changent pas: deux états d'un même niveau ne
+          diffèrent que par les boîtes et le joueur
+        • C'est le hachage de Zobrist des boîtes tenu à jour par move(), combiné à
+          celui de la case du joueur: coût constant, quel que soit le nombre de boîtes
+          (collisions possibles mais très improbables sur 64 bits)
+        • Pratique comme clé d'un ensemble/dictionnaire d'états déjà visités (solveur)
+        """
+        if self.player_x < 0:
+            return self.box_hash
+        return self.box_hash ^ self._zobrist_player[self.player_y * self._width + self.player_x]
 
     def width(self):
         """
@@ -147,34 +297,51 @@ class SokobanModel:
         • Encapsule la logique d'affichage pour maintenir la séparation entre 
           données et représentation
         """
-        pos = (x, y)
-        if pos in self.goals:
-            if pos in self.boxes:
+        flags = self.cell(x, y)
+        if flags & GOAL:
+            if flags & BOX:
                 return Symbol.BOX_ON_GOAL
-            if pos == self.player:
+            if x == self.player_x and y == self.player_y:
                 return Symbol.PLAYER_ON_GOAL
             return Symbol.GOAL
-        if pos in self.boxes:
+        if flags & BOX:
             return Symbol.BOX
-        if pos == self.player:
+        if x == self.player_x and y == self.player_y:
             return Symbol.PLAYER
-        if pos in self.walls:
+        if flags & WALL:
             return Symbol.WALL
         return Symbol.FLOOR
-        
+
     def is_level_complete(self):
         """
         • Vérifie si le niveau est terminé en s'assurant que tous les objectifs 
           sont couverts par des boîtes
-        • Utilise les ensembles pour une vérification efficace
-        """
-        # Vérifier que tous les objectifs sont couverts par des boîtes
-        for goal_pos in self.goals:
-            if goal_pos not in self.boxes:
-                return False
-    
-        # S'assurer qu'il y a au moins un objectif
-        return len(self.goals) > 0
+        • Un objectif libre est une case qui vaut exactement GOAL (le joueur n'est
+          pas stocké dans la grille): une seule recherche d'octet dans la grille suffit
+        """
+        # S'assurer qu'il y a au moins un objectif et qu'aucun n'est libre
+        return self.n_goals > 0 and GOAL not in self.grid
+
+
+# Image associée à chaque symbole affiché
+IMAGE_PATHS = {
+    Symbol.WALL: os.path.join("assets", "wall.png"),
+    Symbol.BOX: os.path.join("assets", "box.png"),
+    Symbol.GOAL: os.path.join("assets", "goal.png"),
+    Symbol.BOX_ON_GOAL: os.path.join("assets", "box-on-goal.png"),
+    Symbol.PLAYER: os.path.join("assets", "player.png"),
+    Symbol.PLAYER_ON_GOAL: os.path.join("assets", "player-on-goal.png")
+}
+
+# Couleurs de secours utilisées quand une image ne peut pas être chargée
+FALLBACK_COLORS = {
+    Symbol.WALL: (255, 160, 60),  # Orange pour les murs
+    Symbol.BOX: (220, 180, 80),   # Tan pour les boîtes
+    Symbol.GOAL: (0, 0, 0),       # Noir pour les objectifs
+    Symbol.BOX_ON_GOAL: (150, 100, 50),  # Marron pour une boîte sur un objectif
+    Symbol.PLAYER: (255, 255, 0),  # Jaune pour le joueur
+    Symbol.PLAYER_ON_GOAL: (255, 200, 0)  # Jaune-orange pour le joueur sur un objectif
+}
 
 
 class SokobanPygameView:
@@ -193,49 +360,58 @@ class SokobanPygameView:
         self.tile_size = tile_size
         self.images = {}
         self.font = pygame.font.SysFont(None, 48)  # Police par défaut, taille 48 pour lisibilité
-        self.load_images()
 
     def load_images(self):
         """
         • Centralise le chargement des images en un seul endroit
         • Utilise un dictionnaire pour associer chaque symbole à son image
         • Inclut un système de secours pour gérer les erreurs de chargement d'images
-        """
-        image_paths = {
-            Symbol.WALL: os.path.join("assets", "wall.png"),
-            Symbol.BOX: os.path.join("assets", "box.png"),
-            Symbol.GOAL: os.path.join("assets", "goal.png"),
-            Symbol.BOX_ON_GOAL: os.path.join("assets", "box-on-goal.png"),
-            Symbol.PLAYER: os.path.join("assets", "player.png"),
-            Symbol.PLAYER_ON_GOAL: os.path.join("assets", "player-on-goal.png")
-        }
-
-        for symbol, path in image_paths.items():
-            try:
-                image = pygame.image.load(path)
+        • Appelée une fois la fenêtre créée: les images sont converties au format de
+          l'écran pour que chaque blit soit une simple copie, sans conversion de pixels
+        • Les fichiers sont lus et décodés en parallèle (threads); la conversion et le
+          redimensionnement restent dans le thread principal
+        """
+        with ThreadPoolExecutor(len(IMAGE_PATHS)) as executor:
+            loaded = list(executor.map(self._load_one, IMAGE_PATHS.values()))
+
+        for symbol, image in zip(IMAGE_PATHS, loaded):
+            if image is not None:
+                # convert_alpha() seulement pour les images avec transparence,
+                # convert() (plus rapide à copier) pour les tuiles opaques
+                if image.get_alpha() is None and image.get_colorkey() is None:
+                    image = image.convert()
+                else:
+                    image = image.convert_alpha()
                 self.images[symbol] = pygame.transform.scale(image, (self.tile_size, self.tile_size))
-            except pygame.error as e:
+            else:
                 # Plan de secours en cas d'échec de chargement d'image
-                print(f"Couldn't load image {path}: {e}")
                 fallback = pygame.Surface((self.tile_size, self.tile_size))
                 fallback.fill(self.get_fallback_color(symbol))
                 self.images[symbol] = fallback
 
+        # Image associée à chaque combinaison de drapeaux, None pour les cases sans image
+        self.images_by_code = [None] * ((BLOCKED | GOAL | PLAYER) + 1)
+        for flags, symbol in SYMBOL_BY_FLAGS.items():
+            self.images_by_code[flags] = self.images.get(symbol)
+
+    def _load_one(self, path):
+        """
+        • Lit et décode une image, appelée depuis un thread de load_images()
+        • Retourne None si l'image ne peut pas être chargée
+        """
+        try:
+            return pygame.image.load(path)
+        except pygame.error as e:
+            print(f"Couldn't load image {path}: {e}")
+            return None
+
     def get_fallback_color(self, symbol):
         """
         • Fournit des couleurs de secours pour chaque type d'élément
         • Permet au jeu de fonctionner même si les images sont absentes
         • Utilise des couleurs distinctives pour chaque élément afin de maintenir la jouabilité
         """
-        colors = {
-            Symbol.WALL: (255, 160, 60),  # Orange pour les murs
-            Symbol.BOX: (220, 180, 80),   # Tan pour les boîtes
-            Symbol.GOAL: (0, 0, 0),       # Noir pour les objectifs
-            Symbol.BOX_ON_GOAL: (150, 100, 50),  # Marron pour une boîte sur un objectif
-            Symbol.PLAYER: (255, 255, 0),  # Jaune pour le joueur
-            Symbol.PLAYER_ON_GOAL: (255, 200, 0)  # Jaune-orange pour le joueur sur un objectif
-        }
-        return colors.get(symbol, (100, 100, 100))  # Gris par défaut
+        return FALLBACK_COLORS.get(symbol, (100, 100, 100))  # Gris par défaut
 
     def setup_display(self, model):
         """
@@ -247,23 +423,45 @@ class SokobanPygameView:
         height = model.height() * self.tile_size
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Sokoban")
+        self.load_images()
+        self.bake_static(model)
+
+    def bake_static(self, model):
+        """
+        • Pré-dessine une fois le fond (sol, murs et objectifs) qui ne change jamais
+        • render() n'a plus qu'à copier ce fond puis dessiner les boîtes et le joueur
+        • À refaire seulement si la disposition du niveau change
+        • Le sol n'est jamais dessiné: seul le remplissage blanc le représente
+        """
+        width = model.width()
+        ts = self.tile_size
+        self.static_bg = pygame.Surface(self.screen.get_size()).convert()
+        self.static_bg.fill((255, 255, 255))  # Fond blanc
+
+        # Seules les cases non vides sont envoyées, toutes en un seul appel à blits()
+        images_by_code = self.images_by_code
+        self.static_bg.blits([
+            (images_by_code[flags & (WALL | GOAL)], ((i % width) * ts, (i // width) * ts))
+            for i, flags in enumerate(model.grid)
+            if flags & (WALL | GOAL)
+        ], doreturn=False)
 
     def render(self, model):
         """
         • Dessine l'état actuel du jeu à l'écran
-        • Utilise le modèle pour déterminer ce qui doit être affiché à chaque position
-        • Ignore les cases de sol pour optimiser le rendu (seul le fond blanc est affiché)
+        • Copie le fond pré-dessiné par bake_static() au lieu de redessiner chaque case
+        • Seuls les éléments mobiles (boîtes et joueur) sont dessinés par-dessus
         """
-        self.screen.fill((255, 255, 255))  # Fond blanc
-
-        # Parcourt chaque case du niveau
-        for y in range(model.height()):
-            for x in range(model.width()):
-                symbol = model.symbol(x, y)
+        self.screen.blit(self.static_bg, (0, 0))
 
-                # Dessine seulement les éléments qui ont une image associée
-                if symbol in self.images:
-                    self.screen.blit(self.images[symbol], (x * self.tile_size, y * self.tile_size))
+        # Boîtes (le drapeau GOAL choisit l'image de boîte sur objectif) puis joueur,
+        # envoyés ensemble en un seul appel à blits()
+        ts = self.tile_size
+        images_by_code = self.images_by_code
+        tiles = [(images_by_code[model.cell(x, y)], (x * ts, y * ts)) for (x, y) in model.box_positions]
+        x, y = model.player_x, model.player_y
+        tiles.append((images_by_code[PLAYER | (model.cell(x, y) & GOAL)], (x * ts, y * ts)))
+        self.screen.blits(tiles, doreturn=False)
 
         pygame.display.flip()  # Met à jour l'affichage
 
@@ -272,6 +470,7 @@ class SokobanPygameView:
         • Affiche des messages temporaires à l'écran (erreurs, succès, etc.)
         • Utilise un fond semi-transparent pour améliorer la lisibilité
         • Centré sur l'écran pour attirer l'attention du joueur
+        • Le message reste affiché jusqu'au prochain render()
         """
         screen = pygame.display.get_surface()
         text_surface = self.font.render(text, True, color)
@@ -285,7 +484,12 @@ class SokobanPygameView:
 
         screen.blit(background, background_rect)
         screen.blit(text_surface, text_rect)
-        pygame.display.flip()
+        # Met à jour seulement la zone du message plutôt que tout l'écran
+        pygame.display.update(background_rect.union(text_rect))
+
+
+# Événement envoyé quand un message d'erreur doit disparaître
+MESSAGE_TIMEOUT = pygame.USEREVENT
 
 
 class SokobanController:
@@ -298,27 +502,23 @@ class SokobanController:
         """
         • Initialise le jeu en chargeant un niveau à partir d'un fichier
         • Crée le modèle, la vue, et configure l'affichage
-        • Stocke le chemin du niveau pour permettre le redémarrage
         """
         with open(xsb_file, "r") as f:
             self.model = SokobanModel(list(f))
         self.view = SokobanPygameView()
         self.view.setup_display(self.model)
-        self.current_level = xsb_file  # Conservé pour la fonctionnalité de redémarrage
 
     def handle_move_response(self, move_response):
         """
         • Traite les réponses aux tentatives de mouvement (succès ou échec)
         • Affiche un message d'erreur temporaire en cas d'échec
-        • Maintient l'affichage à jour même en cas de mouvement invalide
+        • Le message est effacé par un événement MESSAGE_TIMEOUT programmé 500ms plus
+          tard, sans bloquer la boucle: le joueur peut continuer à jouer pendant ce temps
         """
         if move_response != MoveResponse.VALID:
             # Affiche un message d'erreur
             self.view.show_message(move_response.value, color=(255, 100, 100))
-            pygame.time.delay(500)  # Affiche le message pendant 500ms
-
-            # Redessine le plateau
-            self.view.render(self.model)
+            pygame.time.set_timer(MESSAGE_TIMEOUT, 500, loops=1)
 
     def game_loop(self):
         """
@@ -326,7 +526,7 @@ class SokobanController:
           1. Capture les événements utilisateur
           2. Met à jour le modèle
           3. Actualise l'affichage
-        • Utilise une horloge pour limiter la fréquence d'images
+        • Pilotée par les événements: aucun rendu ni calcul entre deux touches
         • Vérifie la complétion du niveau après chaque mouvement valide
         """
         running = True
@@ -335,47 +535,49 @@ class SokobanController:
         self.view.render(self.model)
 
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            # Attend le prochain événement: le processus dort tant que le joueur ne fait rien
+            # L'affichage n'est mis à jour qu'après un changement (mouvement, redémarrage)
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                running = False
+
+            # Fin de l'affichage d'un message d'erreur: redessine le plateau pour l'effacer
+            if event.type == MESSAGE_TIMEOUT:
+                self.view.render(self.model)
+
+            # Gestion des touches
+            if event.type == pygame.KEYDOWN:
+                move_response = None
+
+                # Associe les touches directionnelles et WASD aux déplacements
+                if event.key == pygame.K_w or event.key == pygame.K_UP:
+                    move_response = self.model.move(0, -1)
+                elif event.key == pygame.K_a or event.key == pygame.K_LEFT:
+                    move_response = self.model.move(-1, 0)
+                elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
+                    move_response = self.model.move(0, 1)
+                elif event.key == pygame.K_d or event.key == pygame.K_RIGHT:
+                    move_response = self.model.move(1, 0)
+                elif event.key == pygame.K_ESCAPE:
                     running = False
+                elif event.key == pygame.K_r:  # Redémarrage du niveau
+                    self.model.reset()
+                    self.view.render(self.model)
+                    continue
 
-                # Gestion des touches
-                if event.type == pygame.KEYDOWN:
-                    move_response = None
-
-                    # Associe les touches directionnelles et WASD aux déplacements
-                    if event.key == pygame.K_w or event.key == pygame.K_UP:
-                        move_response = self.model.move(0, -1)
-                    elif event.key == pygame.K_a or event.key == pygame.K_LEFT:
-                        move_response = self.model.move(-1, 0)
-                    elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
-                        move_response = self.model.move(0, 1)
-                    elif event.key == pygame.K_d or event.key == pygame.K_RIGHT:
-                        move_response = self.model.move(1, 0)
-                    elif event.key == pygame.K_ESCAPE:
-                        running = False
-                    elif event.key == pygame.K_r:  # Redémarrage du niveau
-                        with open(self.current_level, "r") as f:
-                            self.model = SokobanModel(list(f))
-                        self.view.render(self.model)
-                        continue
-
-                    # Si un mouvement a été tenté
-                    if move_response:
-                        self.handle_move_response(move_response)
+                # Si un mouvement a été tenté
+                if move_response:
+                    self.handle_move_response(move_response)
 
-                        # Redessine après les mouvements valides
-                        if move_response == MoveResponse.VALID:
-                            self.view.render(self.model)
-
-                            # Vérifie si le niveau est terminé
-                            if self.model.is_level_complete():
-                                self.view.show_message("success", color=(50, 255, 50))
-                                pygame.time.delay(2000)  # Affiche le message de succès pendant 2 secondes
-                                running = False
+                    # Redessine après les mouvements valides
+                    if move_response == MoveResponse.VALID:
+                        self.view.render(self.model)
 
-            # Limite la fréquence d'images
-            pygame.time.Clock().tick(60)
+                        # Vérifie si le niveau est terminé
+                        if self.model.is_level_complete():
+                            self.view.show_message("success", color=(50, 255, 50))
+                            pygame.time.delay(2000)  # Affiche le message de succès pendant 2 secondes
+                            running = False
 
         pygame.quit()
 
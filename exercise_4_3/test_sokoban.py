@@ -0,0 +1,234 @@
+import unittest
+
+from sokoban import BOX, GOAL, WALL, MoveResponse, SokobanModel, Symbol, try_move, zobrist_tables
+
+SIMPLE_LEVEL = (
+    "######",
+    "#-$-.#",
+    "#-$-.#",
+    "#-@--#",
+    "######",
+)
+
+# Level where one box is already on a goal
+PARTIAL_COMPLETE_LEVEL = (
+    "######",
+    "#-$-.#",
+    "#-*-.#",
+    "#-@--#",
+    "######",
+)
+
+# Using a very simple level for completion test
+# Just one box that's already on a goal
+COMPLETE_LEVEL = (
+    "###",
+    "#*#",
+    "#@#",
+    "###",
+)
+
+# One push to the right puts the box on the goal
+ONE_PUSH_LEVEL = (
+    "#####",
+    "#@$.#",
+    "#####",
+)
+
+
+class TestSokobanModel(unittest.TestCase):
+    def test_symbols_after_parsing(self):
+        model = SokobanModel(PARTIAL_COMPLETE_LEVEL)
+        self.assertEqual(model.symbol(0, 0), Symbol.WALL)
+        self.assertEqual(model.symbol(1, 1), Symbol.FLOOR)
+        self.assertEqual(model.symbol(2, 1), Symbol.BOX)
+        self.assertEqual(model.symbol(4, 1), Symbol.GOAL)
+        self.assertEqual(model.symbol(2, 2), Symbol.BOX_ON_GOAL)
+        self.assertEqual(model.symbol(2, 3), Symbol.PLAYER)
+
+    def test_player_can_move_into_empty_space(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        self.assertEqual(model.move(1, 0), MoveResponse.VALID)
+        self.assertEqual((model.player_x, model.player_y), (3, 3))
+
+    def test_player_cannot_move_into_wall(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        self.assertEqual(model.move(0, 1), MoveResponse.INVALID_WALL)
+        self.assertEqual((model.player_x, model.player_y), (2, 3))
+
+    def test_player_can_move_box_into_empty_space(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        self.assertEqual(model.move(1, 0), MoveResponse.VALID)
+        self.assertEqual(model.move(0, -1), MoveResponse.VALID)
+        self.assertEqual(model.move(-1, 0), MoveResponse.VALID)
+        self.assertEqual(model.symbol(1, 2), Symbol.BOX)
+        self.assertIn((1, 2), model.box_positions)
+        self.assertNotIn((2, 2), model.box_positions)
+
+    def test_player_cannot_move_box_into_box(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        self.assertEqual(model.move(0, -1), MoveResponse.INVALID_BOX)
+
+    def test_player_cannot_move_box_into_wall(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        self.assertEqual(model.move(1, 0), MoveResponse.VALID)
+        self.assertEqual(model.move(0, -1), MoveResponse.VALID)
+        self.assertEqual(model.move(-1, 0), MoveResponse.VALID)
+        self.assertEqual(model.move(-1, 0), MoveResponse.INVALID_BOX)
+
+    def test_level_not_complete(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        self.assertFalse(model.is_level_complete())
+
+    def test_level_partially_complete(self):
+        model = SokobanModel(PARTIAL_COMPLETE_LEVEL)
+        self.assertFalse(model.is_level_complete())
+
+    def test_level_complete(self):
+        model = SokobanModel(COMPLETE_LEVEL)
+        self.assertTrue(model.is_level_complete())
+
+    def test_completing_level_through_moves(self):
+        model = SokobanModel(ONE_PUSH_LEVEL)
+        self.assertFalse(model.is_level_complete())
+        self.assertEqual(model.move(1, 0), MoveResponse.VALID)
+        self.assertTrue(model.is_level_complete())
+
+    # reset() must bring back exactly the state of a freshly parsed level,
+    # since the R key relies on it instead of reloading the file
+    def test_reset_restores_initial_state(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        model.move(1, 0)
+        model.move(0, -1)
+        model.move(-1, 0)  # pushes the box at (2, 2) to (1, 2)
+        model.reset()
+
+        fresh = SokobanModel(SIMPLE_LEVEL)
+        self.assertEqual(model.grid, fresh.grid)
+        self.assertEqual((model.player_x, model.player_y), (fresh.player_x, fresh.player_y))
+        self.assertEqual(model.box_positions, fresh.box_positions)
+        self.assertEqual(model.box_hash, fresh.box_hash)
+        self.assertEqual(model.state_key(), fresh.state_key())
+
+    def test_reset_after_completion(self):
+        model = SokobanModel(ONE_PUSH_LEVEL)
+        model.move(1, 0)
+        model.reset()
+        self.assertFalse(model.is_level_complete())
+        self.assertEqual(model.symbol(2, 1), Symbol.BOX)
+
+
+# The Zobrist hash is updated incrementally by move(): after any sequence of
+# moves it must match the hash recomputed from scratch from the grid
+def recompute_state_key(model):
+    box_table, player_table = zobrist_tables(len(model.grid))
+    key = 0
+    for i, flags in enumerate(model.grid):
+        if flags & BOX:
+            key ^= box_table[i]
+    return key ^ player_table[model.player_y * model.width() + model.player_x]
+
+
+class TestZobristHash(unittest.TestCase):
+    def test_hash_after_parsing(self):
+        model = SokobanModel(PARTIAL_COMPLETE_LEVEL)
+        self.assertEqual(model.state_key(), recompute_state_key(model))
+
+    def test_hash_after_walks(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        for dx, dy in [(1, 0), (1, 0), (0, -1), (-1, 0), (0, 1), (0, 1)]:
+            model.move(dx, dy)
+            self.assertEqual(model.state_key(), recompute_state_key(model))
+
+    def test_hash_after_pushes(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        for dx, dy in [(-1, 0), (0, -1), (1, 0), (1, 0), (0, -1), (-1, 0)]:
+            self.assertEqual(model.move(dx, dy), MoveResponse.VALID)
+            self.assertEqual(model.state_key(), recompute_state_key(model))
+        self.assertEqual(sorted(model.box_positions), [(1, 1), (4, 2)])
+
+    def test_hash_after_blocked_moves(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        key = model.state_key()
+        self.assertEqual(model.move(0, 1), MoveResponse.INVALID_WALL)
+        self.assertEqual(model.move(0, -1), MoveResponse.INVALID_BOX)
+        self.assertEqual(model.state_key(), key)
+
+    def test_same_position_through_different_move_orders(self):
+        first = SokobanModel(SIMPLE_LEVEL)
+        for dx, dy in [(1, 0), (0, -1), (-1, 0), (1, 0), (1, 0)]:
+            first.move(dx, dy)
+        second = SokobanModel(SIMPLE_LEVEL)
+        for dx, dy in [(1, 0), (1, 0), (0, -1), (-1, 0), (-1, 0), (1, 0), (1, 0)]:
+            second.move(dx, dy)
+        self.assertEqual(first.grid, second.grid)
+        self.assertEqual((first.player_x, first.player_y), (second.player_x, second.player_y))
+        self.assertEqual(first.state_key(), second.state_key())
+
+    def test_different_positions_have_different_keys(self):
+        model = SokobanModel(SIMPLE_LEVEL)
+        key = model.state_key()
+        model.move(1, 0)
+        self.assertNotEqual(model.state_key(), key)
+
+    def test_tables_shared_between_models(self):
+        first = SokobanModel(SIMPLE_LEVEL)
+        second = SokobanModel(PARTIAL_COMPLETE_LEVEL)
+        self.assertIs(first._zobrist_box, second._zobrist_box)
+        self.assertIs(first._zobrist_player, second._zobrist_player)
+
+
+# try_move() is meant to be called by a solver on its own grids, without a
+# SokobanModel: these tests drive it on bare bytearrays of cell flags
+class TestTryMove(unittest.TestCase):
+    def test_move_into_floor(self):
+        grid = bytearray([0, 0])
+        self.assertEqual(try_move(grid, 2, 1, 0, 0, 1, 0), (MoveResponse.VALID, False))
+        self.assertEqual(grid, bytearray([0, 0]))
+
+    def test_push_box(self):
+        grid = bytearray([0, BOX, 0])
+        self.assertEqual(try_move(grid, 3, 1, 0, 0, 1, 0), (MoveResponse.VALID, True))
+        self.assertEqual(grid, bytearray([0, 0, BOX]))
+
+    def test_push_box_keeps_goals(self):
+        grid = bytearray([0, BOX | GOAL, GOAL])
+        self.assertEqual(try_move(grid, 3, 1, 0, 0, 1, 0), (MoveResponse.VALID, True))
+        self.assertEqual(grid, bytearray([0, GOAL, BOX | GOAL]))
+
+    def test_push_box_vertically(self):
+        # One column, three rows: moving down steps by the grid width
+        grid = bytearray([0, BOX, 0])
+        self.assertEqual(try_move(grid, 1, 3, 0, 0, 0, 1), (MoveResponse.VALID, True))
+        self.assertEqual(grid, bytearray([0, 0, BOX]))
+
+    def test_box_blocked_by_box(self):
+        grid = bytearray([0, BOX, BOX])
+        self.assertEqual(try_move(grid, 3, 1, 0, 0, 1, 0), (MoveResponse.INVALID_BOX, False))
+        self.assertEqual(grid, bytearray([0, BOX, BOX]))
+
+    def test_box_blocked_by_wall(self):
+        grid = bytearray([0, BOX, WALL])
+        self.assertEqual(try_move(grid, 3, 1, 0, 0, 1, 0), (MoveResponse.INVALID_BOX, False))
+        self.assertEqual(grid, bytearray([0, BOX, WALL]))
+
+    def test_move_into_wall(self):
+        grid = bytearray([0, WALL])
+        self.assertEqual(try_move(grid, 2, 1, 0, 0, 1, 0), (MoveResponse.INVALID_WALL, False))
+        self.assertEqual(grid, bytearray([0, WALL]))
+
+    def test_move_off_board(self):
+        grid = bytearray([0, 0])
+        self.assertEqual(try_move(grid, 2, 1, 1, 0, 1, 0), (MoveResponse.INVALID_WALL, False))
+        self.assertEqual(try_move(grid, 2, 1, 0, 0, -1, 0), (MoveResponse.INVALID_WALL, False))
+        self.assertEqual(try_move(grid, 2, 1, 0, 0, 0, 1), (MoveResponse.INVALID_WALL, False))
+        self.assertEqual(grid, bytearray([0, 0]))
+
+    def test_push_box_off_board(self):
+        grid = bytearray([0, BOX])
+        self.assertEqual(try_move(grid, 2, 1, 0, 0, 1, 0), (MoveResponse.INVALID_BOX, False))
+        self.assertEqual(grid, bytearray([0, BOX]))
+
+
+if __name__ == "__main__":
+    unittest.main()